@@ -0,0 +1,393 @@
+"""
+Async Season Mapper Module
+
+asyncio/httpx counterpart of SeasonMapper. Network calls are coroutines sharing
+one HTTP/2 client, so many AniList IDs can be in flight without a thread each.
+Caching, parsing and date matching come from BaseSeasonMapper.
+"""
+
+import asyncio
+import logging
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+from functools import wraps
+from typing import Callable, Dict, Iterable, List, Optional, Tuple
+
+import httpx
+import orjson
+
+from mapper import BaseSeasonMapper, RETRY_BACKOFF_FACTOR, RETRY_STATUS_CODES, RETRY_TOTAL
+
+# Maximum pooled connections across both hosts
+MAX_CONNECTIONS = 32
+
+
+def _retry_after_seconds(retry_after: Optional[str], attempt: int) -> float:
+    """
+    Work out how long to wait before retrying a 429/5xx response.
+
+    Args:
+        retry_after: Retry-After header value (seconds or an HTTP date), if any
+        attempt: Zero-based number of the attempt that failed
+
+    Returns:
+        Seconds to wait; exponential backoff if the header is missing or invalid
+    """
+    if retry_after:
+        if retry_after.strip().isdigit():
+            return float(retry_after)
+
+        try:
+            retry_at = parsedate_to_datetime(retry_after)
+        except (TypeError, ValueError):
+            retry_at = None
+
+        if retry_at is not None:
+            if retry_at.tzinfo is None:
+                retry_at = retry_at.replace(tzinfo=timezone.utc)
+            return max(0.0, (retry_at - datetime.now(timezone.utc)).total_seconds())
+
+    return RETRY_BACKOFF_FACTOR * (2 ** attempt)
+
+
+def _guarded_request_async(bucket_name: str, semaphore_name: str) -> Callable:
+    """
+    Decorate an AsyncSeasonMapper request coroutine with the shared request handling.
+
+    Async counterpart of mapper._guarded_request(). Takes one token from the
+    named rate limiter per call and holds the named semaphore during each
+    attempt. 429/5xx responses are retried with the same policy as the sync
+    session, honoring the Retry-After header; connection errors are retried by
+    the client transport and then turned into None. Empties the bucket if the
+    server still answers 429.
+
+    Args:
+        bucket_name: AsyncSeasonMapper attribute holding the TokenBucket
+        semaphore_name: AsyncSeasonMapper attribute holding the host's semaphore
+
+    Returns:
+        Decorator for coroutines making a single httpx request
+    """
+    def decorator(method: Callable) -> Callable:
+        @wraps(method)
+        async def wrapper(self, *args, **kwargs) -> Optional[httpx.Response]:
+            bucket = getattr(self, bucket_name)
+            await bucket.consume_async()
+
+            for attempt in range(RETRY_TOTAL + 1):
+                try:
+                    async with getattr(self, semaphore_name):
+                        response = await method(self, *args, **kwargs)
+                except httpx.HTTPError as e:
+                    logging.error(f"Request failed after retries: {e}")
+                    return None
+
+                if response.status_code not in RETRY_STATUS_CODES or attempt == RETRY_TOTAL:
+                    break
+
+                wait_time = _retry_after_seconds(response.headers.get("Retry-After"), attempt)
+                logging.warning(
+                    f"HTTP {response.status_code}. Retrying in {wait_time:.1f}s... "
+                    f"(Attempt {attempt + 1}/{RETRY_TOTAL})"
+                )
+                await asyncio.sleep(wait_time)
+
+            if response.status_code == 429:
+                logging.warning(f"Rate limit still exceeded after retries: {response.url}")
+                bucket.drain()
+
+            return response
+        return wrapper
+    return decorator
+
+
+class AsyncSeasonMapper(BaseSeasonMapper):
+    """
+    Maps AniList anime IDs to TMDB season IDs, making requests with asyncio.
+
+    The *_async methods mirror SeasonMapper's request methods as coroutines.
+    The HTTP client only exists while run_chunks() is running; the requests
+    session from BaseSeasonMapper is only used for the Fribb mapping file.
+    """
+
+    def __init__(self, tmdb_api_key: str):
+        """
+        Initialize the AsyncSeasonMapper with TMDB credentials.
+
+        Args:
+            tmdb_api_key: TMDB API key (supports both v3 and v4 formats)
+        """
+        super().__init__(tmdb_api_key)
+        # Fetches in progress, so concurrent callers share one request per show
+        self._seasons_inflight: Dict[int, asyncio.Task] = {}
+        self._client: Optional[httpx.AsyncClient] = None
+        self._anilist_semaphore: Optional[asyncio.Semaphore] = None
+        self._tmdb_semaphore: Optional[asyncio.Semaphore] = None
+
+    def run_chunks(
+        self,
+        chunks: Iterable[List[Tuple[int, Optional[int]]]],
+        on_chunk: Callable[[List[Optional[Dict]]], None]
+    ) -> None:
+        """
+        Process task chunks concurrently on a fresh event loop.
+
+        Args:
+            chunks: Lists of (anilist_id, tmdb_id) tuples, one AniList batch each
+            on_chunk: Called with the results of each chunk as it completes
+        """
+        asyncio.run(self._run_chunks(list(chunks), on_chunk))
+
+    async def _run_chunks(
+        self,
+        chunks: List[List[Tuple[int, Optional[int]]]],
+        on_chunk: Callable[[List[Optional[Dict]]], None]
+    ) -> None:
+        """
+        Open the HTTP client and process all chunks, reporting as they finish.
+
+        Args:
+            chunks: Lists of (anilist_id, tmdb_id) tuples
+            on_chunk: Called with the results of each chunk as it completes
+        """
+        # The Fribb download is a one-off blocking call, keep it off the loop
+        if any(tmdb_id is None for chunk in chunks for _, tmdb_id in chunk):
+            loop = asyncio.get_running_loop()
+            await loop.run_in_executor(None, self.load_mapping_data)
+
+        # Created here so they bind to the running loop. A host never gets
+        # more requests in flight than its bucket can burst.
+        self._anilist_semaphore = asyncio.Semaphore(int(self.anilist_bucket.capacity))
+        self._tmdb_semaphore = asyncio.Semaphore(int(self.tmdb_bucket.capacity))
+
+        # The transport retries connection errors, _guarded_request_async() 429/5xx
+        transport = httpx.AsyncHTTPTransport(
+            http2=True,
+            limits=httpx.Limits(max_connections=MAX_CONNECTIONS),
+            retries=RETRY_TOTAL
+        )
+        async with httpx.AsyncClient(
+            transport=transport,
+            timeout=10,
+            headers={"User-Agent": self._session.headers["User-Agent"]}
+        ) as client:
+            self._client = client
+            try:
+                for future in asyncio.as_completed([self.process_chunk_async(chunk) for chunk in chunks]):
+                    on_chunk(await future)
+            finally:
+                self._client = None
+
+    async def process_chunk_async(
+        self,
+        chunk: List[Tuple[int, Optional[int]]]
+    ) -> List[Optional[Dict]]:
+        """
+        Process a chunk of tasks with a single batched AniList lookup.
+
+        Args:
+            chunk: List of (anilist_id, tmdb_id) tuples
+
+        Returns:
+            One result per task (match dictionary or None)
+        """
+        # Look up missing show IDs first (mapping is preloaded by run_chunks)
+        # so their seasons can be fetched alongside the AniList batch too
+        if any(not tmdb_id for _, tmdb_id in chunk):
+            mapping = self._mapping_data or {}
+            chunk = [(anilist_id, tmdb_id or mapping.get(anilist_id)) for anilist_id, tmdb_id in chunk]
+
+        # Warm the season cache while the AniList batch is in flight. Entries
+        # without a show ID can't match, so they are left out of the batch.
+        tmdb_show_ids = {tmdb_id for _, tmdb_id in chunk if tmdb_id}
+        mapped_ids = [anilist_id for anilist_id, tmdb_id in chunk if tmdb_id]
+        anilist_data, _ = await asyncio.gather(
+            self.get_anilist_batch_async(mapped_ids),
+            asyncio.gather(*(self._get_seasons_entry_async(tmdb_id) for tmdb_id in tmdb_show_ids))
+        )
+        if anilist_data is None:
+            anilist_data = await self.get_anilist_batch_async(mapped_ids)
+
+        if anilist_data is None:
+            # Not recorded as matches, so the next run retries them
+            logging.error(f"Skipping {len(mapped_ids)} IDs after the AniList batch failed twice")
+            return [None] * len(chunk)
+
+        return await asyncio.gather(*(
+            self.process_id_async(anilist_id, tmdb_id, anilist_data=anilist_data.get(anilist_id))
+            for anilist_id, tmdb_id in chunk
+        ))
+
+    @_guarded_request_async("tmdb_bucket", "_tmdb_semaphore")
+    async def _get_json_async(self, url: str) -> Optional[httpx.Response]:
+        """
+        GET a TMDB API endpoint using the precomputed authentication.
+
+        Args:
+            url: TMDB API URL
+
+        Returns:
+            Response object if successful, None if the request failed
+        """
+        return await self._client.get(url, headers=self._tmdb_headers, params=self._tmdb_params)
+
+    @_guarded_request_async("anilist_bucket", "_anilist_semaphore")
+    async def _post_graphql_async(self, body: Dict) -> Optional[httpx.Response]:
+        """
+        POST a GraphQL request to AniList.
+
+        Args:
+            body: GraphQL payload with "query" and optional "variables"
+
+        Returns:
+            Response object if successful, None if the request failed
+        """
+        return await self._client.post(
+            self.anilist_url,
+            content=orjson.dumps(body),
+            headers=self._graphql_headers
+        )
+
+    async def get_anilist_batch_async(
+        self,
+        anilist_ids: List[int]
+    ) -> Optional[Dict[int, Tuple[Optional[str], Optional[str]]]]:
+        """
+        Fetch start dates and titles for several AniList IDs in one request.
+
+        See SeasonMapper.get_anilist_batch() for how failures should be handled.
+
+        Args:
+            anilist_ids: AniList database IDs (at most ANILIST_BATCH_SIZE)
+
+        Returns:
+            Dictionary mapping {anilist_id: (start_date, title)}, or None if
+            the request failed
+        """
+        if not anilist_ids:
+            return {}
+
+        response = await self._post_graphql_async(
+            {'query': self._build_anilist_batch_query(anilist_ids)}
+        )
+        return self._parse_anilist_batch_response(anilist_ids, response)
+
+    async def get_anilist_data_async(self, anilist_id: int) -> Tuple[Optional[str], Optional[str]]:
+        """
+        Fetch start date and title from AniList for a given anime ID.
+
+        Args:
+            anilist_id: The AniList database ID
+
+        Returns:
+            Tuple of (start_date, title) where start_date is in YYYY-MM-DD format,
+            or (None, title) if date is unavailable
+        """
+        batch = await self.get_anilist_batch_async([anilist_id])
+        return (batch or {}).get(anilist_id, (None, None))
+
+    async def get_tmdb_seasons_async(self, tmdb_show_id: int) -> List[Dict]:
+        """
+        Fetch all seasons for a TMDB TV show, using the per-show cache.
+
+        Args:
+            tmdb_show_id: The TMDB show ID (not season ID)
+
+        Returns:
+            List of season dictionaries containing id, season_number, air_date, etc.
+        """
+        return (await self._get_seasons_entry_async(tmdb_show_id))["seasons"]
+
+    async def _get_seasons_entry_async(self, tmdb_show_id: int) -> Dict:
+        """
+        Return the cached season entry for a show, fetching it on a miss.
+
+        Concurrent misses for the same show share a single request.
+
+        Args:
+            tmdb_show_id: The TMDB show ID (not season ID)
+
+        Returns:
+            Cache entry as built by _make_seasons_entry()
+        """
+        with self._seasons_lock:
+            entry = self._seasons_cache.get(tmdb_show_id)
+        if entry is not None:
+            return entry
+
+        task = self._seasons_inflight.get(tmdb_show_id)
+        if task is None:
+            task = asyncio.ensure_future(self._fetch_seasons_entry_async(tmdb_show_id))
+            self._seasons_inflight[tmdb_show_id] = task
+            task.add_done_callback(lambda _: self._seasons_inflight.pop(tmdb_show_id, None))
+
+        # Shielded so one cancelled caller doesn't cancel the shared fetch
+        return await asyncio.shield(task)
+
+    async def _fetch_seasons_entry_async(self, tmdb_show_id: int) -> Dict:
+        """
+        Request a show's seasons from TMDB and cache them.
+
+        Args:
+            tmdb_show_id: The TMDB show ID (not season ID)
+
+        Returns:
+            Cache entry as built by _make_seasons_entry()
+        """
+        response = await self._get_json_async(f"{self.tmdb_base_url}/tv/{tmdb_show_id}")
+        seasons = self._parse_tmdb_seasons_response(tmdb_show_id, response)
+        return self._store_seasons(tmdb_show_id, seasons)
+
+    async def process_id_async(
+        self,
+        anilist_id: int,
+        themoviedb_id: Optional[int] = None,
+        tolerance: int = 7,
+        anilist_data: Optional[Tuple[Optional[str], Optional[str]]] = None
+    ) -> Optional[Dict]:
+        """
+        Process a single AniList ID and find its corresponding TMDB season.
+
+        See SeasonMapper.process_id() for the algorithm and return format.
+
+        Args:
+            anilist_id: The AniList anime ID
+            themoviedb_id: Optional TMDB show ID (will be looked up if None)
+            tolerance: Maximum days difference to consider a match (default: 7)
+            anilist_data: Optional prefetched (start_date, title) from
+                get_anilist_batch_async(); fetched individually if None
+
+        Returns:
+            Dictionary containing mapping information if match found, None otherwise.
+        """
+        # Step 1: Get TMDB show ID (mapping is preloaded by run_chunks)
+        if not themoviedb_id:
+            themoviedb_id = (self._mapping_data or {}).get(anilist_id)
+
+        if not themoviedb_id:
+            logging.warning(f"No mapping found for AniList ID {anilist_id}")
+            return None
+
+        # Steps 2 and 3: Get AniList start date and TMDB seasons concurrently
+        if anilist_data is None:
+            anilist_data, seasons_entry = await asyncio.gather(
+                self.get_anilist_data_async(anilist_id),
+                self._get_seasons_entry_async(themoviedb_id)
+            )
+        else:
+            seasons_entry = None
+
+        anilist_date, title = anilist_data
+        if not anilist_date:
+            logging.warning(f"No start date found for AniList ID {anilist_id}")
+            return None
+
+        logging.info(f"Processing: {title} | Date: {anilist_date}")
+
+        if seasons_entry is None:
+            seasons_entry = await self._get_seasons_entry_async(themoviedb_id)
+
+        # Step 4: Find closest matching season by date
+        return self._match_season(
+            anilist_id, title, anilist_date, themoviedb_id, seasons_entry, tolerance
+        )
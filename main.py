@@ -5,16 +5,26 @@ Main entry point for the season mapping tool. Provides CLI interface for
 processing single IDs or batch operations.
 
 Usage:
-    python main.py
+    python main.py           # thread pool
+    python main.py --async   # asyncio + HTTP/2 (httpx)
 """
 
 import os
-import json
-import time
 import sys
-from typing import List, Tuple, Optional
+import orjson
+from itertools import islice
+from typing import Iterator, List, Tuple, Optional
 from dotenv import load_dotenv
-from mapper import SeasonMapper
+from tqdm import tqdm
+from tqdm.contrib.logging import logging_redirect_tqdm
+from async_mapper import AsyncSeasonMapper
+from mapper import ANILIST_BATCH_SIZE, BaseSeasonMapper, SeasonMapper
+
+# Matches are appended here as they are found, one JSON object per line
+RESULTS_FILE = "results.jsonl"
+
+# Pretty-printed export of all results (and the results file of older versions)
+JSON_RESULTS_FILE = "results.json"
 
 
 def load_api_key() -> str:
@@ -39,17 +49,113 @@ def load_api_key() -> str:
     return api_key
 
 
-def save_results(results: List[dict], filename: str = "results.json") -> None:
+def load_results(filename: str = RESULTS_FILE) -> List[dict]:
+    """
+    Load previously saved matches from a JSON Lines file.
+
+    Unparseable lines (e.g. a line cut short by a crash) are skipped.
+
+    Args:
+        filename: Path to the JSON Lines results file
+
+    Returns:
+        List of mapping dictionaries, empty if the file doesn't exist
+    """
+    results = []
+    if not os.path.exists(filename):
+        return results
+
+    with open(filename, "r", encoding="utf-8") as f:
+        for line in f:
+            line = line.strip()
+            if not line:
+                continue
+            try:
+                results.append(orjson.loads(line))
+            except ValueError:
+                continue
+
+    return results
+
+
+def read_json_results(filename: str = JSON_RESULTS_FILE) -> Optional[List[dict]]:
+    """
+    Read results stored as a single JSON array.
+
+    Args:
+        filename: Path to the JSON results file
+
+    Returns:
+        List of mapping dictionaries, or None if the file doesn't exist or
+        isn't a readable JSON array
+    """
+    if not os.path.exists(filename):
+        return None
+
+    try:
+        with open(filename, "rb") as f:
+            results = orjson.loads(f.read())
+    except (OSError, ValueError) as e:
+        print(f"⚠️  Warning: Could not read {filename}: {e}")
+        return None
+
+    if not isinstance(results, list):
+        print(f"⚠️  Warning: {filename} does not contain a list of results")
+        return None
+
+    return results
+
+
+def migrate_legacy_results(
+    source: str = JSON_RESULTS_FILE, destination: str = RESULTS_FILE
+) -> None:
+    """
+    Seed the JSON Lines results file from a results.json of an older version.
+
+    Only runs when the JSON Lines file doesn't exist yet, so IDs mapped by
+    earlier runs are still skipped after upgrading.
+
+    Args:
+        source: Legacy JSON results file (default: results.json)
+        destination: JSON Lines results file (default: results.jsonl)
+    """
+    if os.path.exists(destination):
+        return
+
+    legacy = read_json_results(source)
+    if not legacy:
+        return
+
+    with open(destination, "w", encoding="utf-8") as f:
+        for item in legacy:
+            f.write(orjson.dumps(item).decode() + "\n")
+    print(f"📦 Migrated {len(legacy)} existing results from {source} to {destination}")
+
+
+def convert_jsonl_to_json(
+    source: str = RESULTS_FILE, destination: str = JSON_RESULTS_FILE
+) -> None:
     """
-    Save mapping results to a JSON file.
+    Write the accumulated JSON Lines results as a single JSON array.
+
+    An existing destination is never replaced by fewer records than it
+    already holds (or when it can't be read), so no results are lost.
 
     Args:
-        results: List of mapping dictionaries
-        filename: Output filename (default: results.json)
+        source: JSON Lines results file (default: results.jsonl)
+        destination: Output filename (default: results.json)
     """
-    with open(filename, "w", encoding="utf-8") as f:
-        json.dump(results, f, indent=2, ensure_ascii=False)
-    print(f"\n✅ Saved {len(results)} matches to {filename}")
+    results = load_results(source)
+
+    if os.path.exists(destination):
+        existing = read_json_results(destination)
+        if existing is None or len(existing) > len(results):
+            print(f"\n⚠️  Not overwriting {destination}: it holds results missing from {source}.")
+            return
+
+    with open(destination, "w", encoding="utf-8") as f:
+        f.write(orjson.dumps(results, option=orjson.OPT_INDENT_2).decode())
+    print(f"\n✅ Saved {len(results)} matches to {destination}")
 
 
 def load_ids_from_file(filename: str = "input_ids.txt") -> List[Tuple[int, None]]:
@@ -72,20 +178,20 @@ def load_ids_from_file(filename: str = "input_ids.txt") -> List[Tuple[int, None]
             stripped = line.strip()
             if not stripped:
                 continue
-            if not stripped.isdigit():
+            try:
+                ids.append(int(stripped))
+            except ValueError:
                 print(f"⚠️  Warning: Skipping invalid ID on line {line_num}: {stripped}")
-                continue
-            ids.append(int(stripped))
 
         return [(uid, None) for uid in ids]
 
 
-def process_custom_file(mapper: SeasonMapper) -> List[dict]:
+def process_custom_file(mapper: BaseSeasonMapper) -> List[dict]:
     """
     Process IDs from input_ids.txt file.
 
     Args:
-        mapper: Configured SeasonMapper instance
+        mapper: Configured SeasonMapper or AsyncSeasonMapper
 
     Returns:
         List of successful matches
@@ -101,12 +207,12 @@ def process_custom_file(mapper: SeasonMapper) -> List[dict]:
     return process_tasks(mapper, tasks)
 
 
-def process_full_database(mapper: SeasonMapper) -> List[dict]:
+def process_full_database(mapper: BaseSeasonMapper) -> List[dict]:
     """
     Process all IDs from the Fribb anime-lists database.
 
     Args:
-        mapper: Configured SeasonMapper instance
+        mapper: Configured SeasonMapper or AsyncSeasonMapper
 
     Returns:
         List of successful matches
@@ -125,30 +231,47 @@ def process_full_database(mapper: SeasonMapper) -> List[dict]:
     return process_tasks(mapper, tasks)
 
 
+def chunk_tasks(
+    tasks: List[Tuple[int, Optional[int]]], size: int
+) -> Iterator[List[Tuple[int, Optional[int]]]]:
+    """
+    Split tasks into consecutive chunks.
+
+    Args:
+        tasks: List of (anilist_id, tmdb_id) tuples
+        size: Maximum chunk length
+
+    Yields:
+        Lists of at most `size` tasks
+    """
+    iterator = iter(tasks)
+    while True:
+        chunk = list(islice(iterator, size))
+        if not chunk:
+            return
+        yield chunk
+
+
 def process_tasks(
-    mapper: SeasonMapper, tasks: List[Tuple[int, Optional[int]]]
+    mapper: BaseSeasonMapper, tasks: List[Tuple[int, Optional[int]]]
 ) -> List[dict]:
     """
     Process a list of AniList IDs and return successful matches.
 
+    Each match is appended to RESULTS_FILE as soon as it is found, so an
+    interrupted run loses nothing and the next run skips those IDs.
+
     Args:
-        mapper: Configured SeasonMapper instance
+        mapper: Configured SeasonMapper or AsyncSeasonMapper
         tasks: List of (anilist_id, tmdb_id) tuples
 
     Returns:
         List of successful match dictionaries
     """
-    results = []
-    processed_ids = set()
-
     # Load existing results to skip processed IDs
-    if os.path.exists("results.json"):
-        try:
-            with open("results.json", "r", encoding="utf-8") as f:
-                results = json.load(f)
-                processed_ids = {item.get("anilist_id") for item in results if item.get("anilist_id")}
-        except Exception:
-            pass
+    migrate_legacy_results()
+    results = load_results()
+    processed_ids = {item.get("anilist_id") for item in results if item.get("anilist_id")}
 
     tasks = [t for t in tasks if t[0] not in processed_ids]
     total = len(tasks)
@@ -161,27 +284,37 @@ def process_tasks(
     print("=" * 60)
 
     initial_count = len(results)
+    processed = 0
+    chunks = chunk_tasks(tasks, ANILIST_BATCH_SIZE)
 
-    try:
-        for index, (anilist_id, tmdb_id) in enumerate(tasks):
-            # Progress indicator every 10 items
-            if index % 10 == 0 and index > 0:
-                new_matches = len(results) - initial_count
-                success_rate = new_matches / index * 100 if index > 0 else 0
-                print(f"📊 Progress: {index}/{total} ({success_rate:.1f}% match rate)")
-
-            match = mapper.process_id(anilist_id, tmdb_id)
-            if match:
-                results.append(match)
-
-            # Rate limiting
-            # AniList: 90 requests/min, TMDB: generally permissive
-            # AniList temporary 30 request/min rate limit
-            time.sleep(2.1)
-
-    except KeyboardInterrupt:
-        print("\n\n⚠️  Process interrupted by user.")
-        print(f"Processed {index + 1}/{total} items before interruption.")
+    interrupted = False
+
+    # Line-buffered so every match reaches the file as soon as it is written
+    with open(RESULTS_FILE, "a", encoding="utf-8", buffering=1) as out:
+
+        def record_chunk(chunk_results: List[Optional[dict]]) -> None:
+            nonlocal processed
+            processed += len(chunk_results)
+            for match in chunk_results:
+                if match:
+                    out.write(orjson.dumps(match).decode() + "\n")
+                    results.append(match)
+
+            new_matches = len(results) - initial_count
+            pbar.update(len(chunk_results))
+            pbar.set_postfix(match_rate=f"{new_matches / processed * 100:.1f}%")
+
+        # Log lines are written above the bar instead of tearing it
+        with tqdm(total=total, desc="Mapping", smoothing=0.1) as pbar, logging_redirect_tqdm():
+            try:
+                mapper.run_chunks(chunks, record_chunk)
+
+            except KeyboardInterrupt:
+                interrupted = True
+
+    if interrupted:
+        print("\n⚠️  Process interrupted by user.")
+        print(f"Processed {processed}/{total} items before interruption.")
 
     print("=" * 60)
     print(
@@ -216,23 +349,24 @@ def main() -> None:
     """
     # Load configuration
     api_key = load_api_key()
-    mapper = SeasonMapper(api_key)
 
     # Display menu and get choice
     choice = display_menu()
 
     # Process based on user selection
-    if choice == "1":
-        results = process_custom_file(mapper)
-    elif choice == "2":
-        results = process_full_database(mapper)
-    else:
-        print("❌ Invalid choice. Please enter 1 or 2.")
-        return
-
-    # Save results if any were found
+    mapper_class = AsyncSeasonMapper if "--async" in sys.argv[1:] else SeasonMapper
+    with mapper_class(api_key) as mapper:
+        if choice == "1":
+            results = process_custom_file(mapper)
+        elif choice == "2":
+            results = process_full_database(mapper)
+        else:
+            print("❌ Invalid choice. Please enter 1 or 2.")
+            return
+
+    # Export results as a JSON array if any were found
     if results:
-        save_results(results)
+        convert_jsonl_to_json()
     else:
         print("\n⚠️  No matches found. No output file created.")
 
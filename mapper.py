@@ -5,11 +5,74 @@ Handles API communication with AniList and TMDB to map anime season IDs
 using a date-anchoring algorithm.
 """
 
+import asyncio
+import ijson
+import orjson
 import requests
 import logging
+import os
+import pickle
+import threading
 import time
-from datetime import datetime
-from typing import Optional, Dict, List, Tuple
+import urllib3
+from abc import ABC, abstractmethod
+from concurrent.futures import Future, ThreadPoolExecutor, as_completed, wait
+from datetime import date
+from functools import lru_cache, wraps
+from typing import Callable, Optional, Dict, Iterable, List, Tuple
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+# Maximum number of aliased Media lookups per AniList request
+ANILIST_BATCH_SIZE = 30
+
+# Worker threads for SeasonMapper.run_chunks(); request pacing is handled by
+# the per-host token buckets, so this only bounds in-flight requests.
+MAX_WORKERS = 16
+
+# Retry policy shared by the sync and async HTTP clients
+RETRY_TOTAL = 3
+RETRY_BACKOFF_FACTOR = 0.5
+RETRY_STATUS_CODES = (429, 500, 502, 503, 504)
+
+_ANILIST_MEDIA_QUERY = '''
+query ($id: Int) {
+    Media (id: $id, type: ANIME) {
+        startDate { year month day }
+        title { romaji english }
+    }
+}
+'''
+
+# One aliased lookup per ID, formatted with (alias index, anilist_id)
+_ANILIST_MEDIA_BATCH_FRAGMENT = (
+    'm%d: Media(id: %d, type: ANIME) '
+    '{ startDate { year month day } title { romaji english } }'
+)
+
+
+@lru_cache(maxsize=4096)
+def _parse_ymd(value: str) -> Optional[int]:
+    """
+    Convert a YYYY-MM-DD date string to its proleptic Gregorian ordinal.
+    
+    Slices the fixed-width fields directly instead of going through strptime.
+    Cached because the same dates recur across shows and AniList entries.
+    
+    Args:
+        value: Date string in YYYY-MM-DD format
+        
+    Returns:
+        Day ordinal, or None if the string is not a valid date
+    """
+    if len(value) != 10 or value[4] != '-' or value[7] != '-':
+        return None
+        
+    try:
+        return date(int(value[0:4]), int(value[5:7]), int(value[8:10])).toordinal()
+    except ValueError:
+        return None
+
 
 # Configure logging
 logging.basicConfig(
@@ -19,23 +82,172 @@ logging.basicConfig(
 )
 
 
-class SeasonMapper:
+class TokenBucket:
     """
-    Maps AniList anime IDs to specific TMDB season IDs using air date matching.
+    Token-bucket rate limiter for a single API host.
+    
+    Each request consumes one token. Tokens refill continuously at
+    ``rate_per_sec`` up to ``capacity``, so short bursts are allowed while the
+    long-run request rate stays within the quota. Safe to share between threads.
+    
+    Attributes:
+        capacity (float): Maximum number of tokens the bucket can hold
+        rate_per_sec (float): Tokens added per second
+        tokens (float): Tokens currently available
+        last_refill (float): Monotonic timestamp of the last refill
+    """
+    
+    def __init__(self, capacity: float, rate: float):
+        """
+        Initialize a full bucket.
+        
+        Args:
+            capacity: Maximum burst size in requests
+            rate: Refill rate in requests per second
+        """
+        self.capacity = capacity
+        self.rate_per_sec = rate
+        self.tokens = capacity
+        self.last_refill = time.monotonic()
+        self._lock = threading.Lock()
+
+    def _refill(self) -> None:
+        """Add the tokens accrued since the last refill, capped at capacity."""
+        now = time.monotonic()
+        elapsed = now - self.last_refill
+        self.tokens = min(self.capacity, self.tokens + elapsed * self.rate_per_sec)
+        self.last_refill = now
+
+    def _take(self, n: int) -> float:
+        """
+        Take ``n`` tokens if they are available.
+        
+        Args:
+            n: Number of tokens to consume
+            
+        Returns:
+            0 if the tokens were taken, otherwise seconds until they will be
+        """
+        with self._lock:
+            self._refill()
+            if self.tokens >= n:
+                self.tokens -= n
+                return 0
+            return (n - self.tokens) / self.rate_per_sec
+
+    def consume(self, n: int = 1, stop: Optional[threading.Event] = None) -> bool:
+        """
+        Take ``n`` tokens from the bucket, sleeping until they are available.
+        
+        Args:
+            n: Number of tokens to consume (default: 1)
+            stop: Optional event that abandons the wait once set
+            
+        Returns:
+            True if the tokens were taken, False if ``stop`` was set first
+        """
+        while True:
+            if stop is not None and stop.is_set():
+                return False
+            wait_time = self._take(n)
+            if not wait_time:
+                return True
+            if stop is None:
+                time.sleep(wait_time)
+            else:
+                stop.wait(wait_time)
+
+    async def consume_async(self, n: int = 1) -> None:
+        """
+        Take ``n`` tokens from the bucket, yielding to the event loop while waiting.
+        
+        Args:
+            n: Number of tokens to consume (default: 1)
+        """
+        while True:
+            wait_time = self._take(n)
+            if not wait_time:
+                return
+            await asyncio.sleep(wait_time)
+
+    def drain(self) -> None:
+        """Empty the bucket, e.g. after the server reports a rate limit."""
+        with self._lock:
+            self._refill()
+            self.tokens = 0
+
+
+class _RunStopped(Exception):
+    """Raised by SeasonMapper request methods once run_chunks() is stopping."""
+
+
+def _guarded_request(bucket_name: Optional[str] = None) -> Callable:
+    """
+    Decorate a mapper request method with the shared request handling.
+    
+    Waits for a token from the named rate limiter before the call (raising
+    _RunStopped instead once the mapper's _stop_event is set), turns request
+    exceptions into None and empties the bucket if the server still answers 429. Retries on connection errors and 429/5xx responses (honoring
+    Retry-After) are handled by the session's retry adapter.
+    
+    Args:
+        bucket_name: Mapper attribute holding the TokenBucket, or None
+            for unthrottled hosts
+            
+    Returns:
+        Decorator for methods returning a requests.Response
+    """
+    def decorator(method: Callable) -> Callable:
+        @wraps(method)
+        def wrapper(self, *args, **kwargs) -> Optional[requests.Response]:
+            bucket = getattr(self, bucket_name) if bucket_name else None
+            if bucket and not bucket.consume(stop=self._stop_event):
+                raise _RunStopped()
+                
+            try:
+                response = method(self, *args, **kwargs)
+            except requests.exceptions.RequestException as e:
+                logging.error(f"Request failed after retries: {e}")
+                return None
+                
+            if response.status_code == 429:
+                logging.warning(f"Rate limit still exceeded after retries: {response.url}")
+                if bucket:
+                    bucket.drain()
+                    
+            return response
+        return wrapper
+    return decorator
+
+
+class BaseSeasonMapper(ABC):
+    """
+    Configuration, caches and response handling shared by the season mappers.
     
     The mapper uses the Fribb/anime-lists database to get initial TMDB show IDs,
     then performs fuzzy date matching to identify the correct season within that show.
+    Subclasses supply the AniList and TMDB requests and run_chunks().
     
     Attributes:
         tmdb_api_key (str): TMDB API key (v3 key or v4 bearer token)
         mapping_url (str): URL to Fribb anime-lists mapping file
         anilist_url (str): AniList GraphQL API endpoint
         tmdb_base_url (str): TMDB API base URL
+        mapping_cache_path (str): Local cache file for the parsed Fribb mapping
+        mapping_cache_ttl (int): Seconds before the cached mapping is revalidated
+        seasons_cache_path (str): Local cache file for TMDB season lists
+        seasons_cache_ttl (int): Seconds before a cached season list is refetched
+    
+    The mapper holds an HTTP session; use it as a context manager or call
+    close() when done.
     """
     
+    # Connections kept per host by the requests session
+    _session_pool_size = 1
+    
     def __init__(self, tmdb_api_key: str):
         """
-        Initialize the SeasonMapper with TMDB credentials.
+        Initialize the mapper with TMDB credentials.
         
         Args:
             tmdb_api_key: TMDB API key (supports both v3 and v4 formats)
@@ -44,54 +256,102 @@ class SeasonMapper:
         self.mapping_url = "https://raw.githubusercontent.com/Fribb/anime-lists/master/anime-list-full.json"
         self.anilist_url = "https://graphql.anilist.co"
         self.tmdb_base_url = "https://api.themoviedb.org/3"
+        
+        # Support both API key and Bearer token authentication
+        if len(tmdb_api_key) > 60:  # v4 Bearer token
+            self._tmdb_headers = {"Authorization": f"Bearer {tmdb_api_key}"}
+            self._tmdb_params = {}
+        else:  # v3 API key
+            self._tmdb_headers = {}
+            self._tmdb_params = {"api_key": tmdb_api_key}
+        self._graphql_headers = {"Content-Type": "application/json"}
+            
+        self.mapping_cache_path = "fribb_cache.pkl"
+        self.mapping_cache_ttl = 24 * 60 * 60
         self._mapping_data: Optional[Dict[int, int]] = None
+        self._mapping_lock = threading.Lock()
+        
+        # Season lists per TMDB show, shared by every AniList entry of that show
+        self.seasons_cache_path = "tmdb_seasons_cache.json"
+        self.seasons_cache_ttl = 7 * 24 * 60 * 60
+        self._seasons_cache: Dict[int, Dict] = self._read_seasons_cache()
+        self._seasons_lock = threading.Lock()
+        
+        # Per-host rate limiting
+        # AniList: temporary 30 requests/min limit, TMDB: generally permissive
+        self.anilist_bucket = TokenBucket(capacity=30, rate=30 / 60)
+        self.tmdb_bucket = TokenBucket(capacity=40, rate=40)
+        
+        # Shared session so connections (and TLS handshakes) are reused
+        retry = Retry(
+            total=RETRY_TOTAL,
+            backoff_factor=RETRY_BACKOFF_FACTOR,
+            status_forcelist=RETRY_STATUS_CODES,
+            allowed_methods=None,  # AniList queries are POSTs, retry them too
+            respect_retry_after_header=True,
+            raise_on_status=False,
+        )
+        adapter = HTTPAdapter(
+            pool_connections=4, pool_maxsize=self._session_pool_size, max_retries=retry
+        )
+        self._session = requests.Session()
+        self._session.mount("https://", adapter)
+        self._session.headers.update({
+            "Accept-Encoding": "gzip, deflate",
+            "User-Agent": "anilist-tmdb-season-mapper",
+        })
+
+    def close(self) -> None:
+        """Save the season cache and close the HTTP session and its pooled connections."""
+        self.save_seasons_cache()
+        self._session.close()
+
+    def __enter__(self) -> "BaseSeasonMapper":
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        self.close()
 
-    def _make_request(
+    @abstractmethod
+    def run_chunks(
+        self, 
+        chunks: Iterable[List[Tuple[int, Optional[int]]]], 
+        on_chunk: Callable[[List[Optional[Dict]]], None]
+    ) -> None:
+        """
+        Process task chunks concurrently, one batched AniList lookup each.
+        
+        Args:
+            chunks: Lists of (anilist_id, tmdb_id) tuples, at most ANILIST_BATCH_SIZE each
+            on_chunk: Called with the results of each chunk as it completes
+        """
+
+    @_guarded_request()
+    def _download_stream(
         self, 
-        method: str, 
         url: str, 
-        **kwargs
+        headers: Optional[Dict[str, str]] = None
     ) -> Optional[requests.Response]:
         """
-        Make an HTTP request with automatic rate limit handling.
-        
-        Automatically retries on 429 (rate limit) errors using the Retry-After header.
+        Start a streamed download; the caller reads and closes the response.
         
         Args:
-            method: HTTP method (GET, POST, etc.)
-            url: Target URL
-            **kwargs: Additional arguments passed to requests.request()
+            url: File URL
+            headers: Extra request headers (e.g. conditional GET validators)
             
         Returns:
             Response object if successful, None if all retries failed
         """
-        retries = 3
-        for attempt in range(retries):
-            try:
-                response = requests.request(method, url, timeout=10, **kwargs)
-                
-                # Handle rate limiting
-                if response.status_code == 429:
-                    wait_time = int(response.headers.get("Retry-After", 5))
-                    logging.warning(f"Rate limit hit. Retrying in {wait_time}s... (Attempt {attempt + 1}/{retries})")
-                    time.sleep(wait_time)
-                    continue
-                    
-                return response
-                
-            except requests.exceptions.RequestException as e:
-                logging.error(f"Request error on attempt {attempt + 1}/{retries}: {e}")
-                if attempt < retries - 1:
-                    time.sleep(2)  # Brief pause before retry
-                    
-        return None
+        return self._session.get(url, headers=headers, stream=True, timeout=10)
 
     def load_mapping_data(self) -> Dict[int, int]:
         """
         Download and parse the Fribb/anime-lists mapping file.
         
         Creates a dictionary mapping AniList IDs to TMDB show IDs. Results are
-        cached after the first call.
+        cached after the first call; concurrent callers wait for a single download.
+        The parsed mapping is also cached on disk and revalidated with a
+        conditional GET once it is older than mapping_cache_ttl.
         
         Returns:
             Dictionary mapping {anilist_id: tmdb_show_id}
@@ -99,107 +359,389 @@ class SeasonMapper:
         if self._mapping_data:
             return self._mapping_data
 
+        with self._mapping_lock:
+            if self._mapping_data:
+                return self._mapping_data
+            return self._download_mapping_data()
+
+    def _read_mapping_cache(self) -> Optional[Dict]:
+        """
+        Read the on-disk mapping cache.
+        
+        Returns:
+            Dictionary with etag, last_modified, fetched_at and mapping keys,
+            or None if the cache is missing or unreadable
+        """
+        if not os.path.exists(self.mapping_cache_path):
+            return None
+            
+        try:
+            with open(self.mapping_cache_path, "rb") as f:
+                cache = pickle.load(f)
+        except Exception as e:
+            # Unpickling can fail in many ways (truncated file, renamed
+            # classes, other Python versions), all of which mean "no cache"
+            logging.warning(f"Ignoring unreadable mapping cache: {e}")
+            return None
+            
+        if (
+            not isinstance(cache, dict)
+            or not {"etag", "last_modified", "fetched_at", "mapping"} <= cache.keys()
+            or not isinstance(cache["fetched_at"], (int, float))
+            or not isinstance(cache["mapping"], dict)
+        ):
+            logging.warning("Ignoring malformed mapping cache")
+            return None
+            
+        return cache
+
+    def _write_mapping_cache(
+        self, 
+        mapping: Dict[int, int], 
+        etag: Optional[str], 
+        last_modified: Optional[str]
+    ) -> None:
+        """
+        Persist the parsed mapping together with its HTTP validators.
+        
+        Args:
+            mapping: Dictionary mapping {anilist_id: tmdb_show_id}
+            etag: ETag header of the downloaded file
+            last_modified: Last-Modified header of the downloaded file
+        """
+        cache = {
+            "etag": etag,
+            "last_modified": last_modified,
+            "fetched_at": time.time(),
+            "mapping": mapping,
+        }
+        try:
+            with open(self.mapping_cache_path, "wb") as f:
+                pickle.dump(cache, f, protocol=pickle.HIGHEST_PROTOCOL)
+        except OSError as e:
+            logging.warning(f"Could not write mapping cache: {e}")
+
+    def _download_mapping_data(self) -> Dict[int, int]:
+        """
+        Fetch the Fribb mapping file and populate the in-memory cache.
+        
+        Uses the on-disk cache directly while it is fresh, otherwise revalidates
+        it with If-None-Match/If-Modified-Since and only downloads on change.
+        
+        Returns:
+            Dictionary mapping {anilist_id: tmdb_show_id}, empty on failure
+        """
+        cache = self._read_mapping_cache()
+        headers = {}
+        
+        if cache:
+            if time.time() - cache["fetched_at"] < self.mapping_cache_ttl:
+                self._mapping_data = cache["mapping"]
+                logging.info(f"Loaded {len(self._mapping_data)} mappings from cache.")
+                return self._mapping_data
+                
+            if cache["etag"]:
+                headers["If-None-Match"] = cache["etag"]
+            if cache["last_modified"]:
+                headers["If-Modified-Since"] = cache["last_modified"]
+
         logging.info("Downloading mapping data from Fribb/anime-lists...")
-        response = self._make_request("GET", self.mapping_url)
+        response = self._download_stream(self.mapping_url, headers=headers)
         
-        if not response or response.status_code != 200:
-            logging.error("Failed to download mapping file.")
-            return {}
+        if response is None:
+            return self._fall_back_to_mapping_cache(cache)
 
         try:
-            raw_data = response.json()
-            
-            # Filter for entries with both IDs present
-            self._mapping_data = {
-                item['anilist_id']: item['themoviedb_id']
-                for item in raw_data
-                if 'anilist_id' in item and 'themoviedb_id' in item
-            }
+            if response.status_code == 304 and cache:
+                self._write_mapping_cache(cache["mapping"], cache["etag"], cache["last_modified"])
+                self._mapping_data = cache["mapping"]
+                logging.info(f"Mapping file unchanged, loaded {len(self._mapping_data)} mappings from cache.")
+                return self._mapping_data
+                
+            if response.status_code != 200:
+                return self._fall_back_to_mapping_cache(cache)
+                
+            # Stream-parse the array so only the two IDs we need are kept,
+            # instead of materializing the whole file in memory
+            response.raw.decode_content = True
+            mapping = {}
+            for item in ijson.items(response.raw, 'item'):
+                # Filter for entries with both IDs present
+                if 'anilist_id' in item and 'themoviedb_id' in item:
+                    mapping[item['anilist_id']] = item['themoviedb_id']
             
+            self._write_mapping_cache(
+                mapping, 
+                response.headers.get("ETag"), 
+                response.headers.get("Last-Modified")
+            )
+            self._mapping_data = mapping
             logging.info(f"Loaded {len(self._mapping_data)} valid mappings.")
             return self._mapping_data
             
-        except (ValueError, KeyError) as e:
+        except (ijson.JSONError, ValueError, KeyError) as e:
             logging.error(f"Error parsing mapping data: {e}")
-            return {}
+            return self._fall_back_to_mapping_cache(cache)
+            
+        # ijson reads the raw urllib3 stream, so a dropped connection, read
+        # timeout or bad gzip data mid-download surfaces here, not in requests
+        except (urllib3.exceptions.HTTPError, requests.exceptions.RequestException) as e:
+            logging.error(f"Mapping download interrupted: {e}")
+            return self._fall_back_to_mapping_cache(cache)
+            
+        finally:
+            response.close()
 
-    def get_anilist_data(self, anilist_id: int) -> Tuple[Optional[str], Optional[str]]:
+    def _fall_back_to_mapping_cache(self, cache: Optional[Dict]) -> Dict[int, int]:
         """
-        Fetch start date and title from AniList for a given anime ID.
+        Use a stale on-disk mapping when the download fails.
         
         Args:
-            anilist_id: The AniList database ID
+            cache: Cache dictionary from _read_mapping_cache(), if any
             
         Returns:
-            Tuple of (start_date, title) where start_date is in YYYY-MM-DD format,
-            or (None, title) if date is unavailable
+            The cached mapping, or an empty dictionary if there is none
         """
-        query = '''
-        query ($id: Int) {
-            Media (id: $id, type: ANIME) {
-                startDate { year month day }
-                title { romaji english }
-            }
-        }
-        '''
-        
-        response = self._make_request(
-            "POST", 
-            self.anilist_url, 
-            json={'query': query, 'variables': {'id': anilist_id}}
-        )
+        if not cache:
+            logging.error("Failed to download mapping file.")
+            return {}
+            
+        logging.warning("Failed to download mapping file, using stale cache.")
+        self._mapping_data = cache["mapping"]
+        return self._mapping_data
+
+    def _parse_anilist_response(
+        self, 
+        anilist_id: int, 
+        response
+    ) -> Tuple[Optional[str], Optional[str]]:
+        """
+        Parse a single-Media AniList response.
         
-        if not response or response.status_code != 200:
+        Args:
+            anilist_id: The AniList database ID that was requested
+            response: HTTP response (requests or httpx), or None if the request failed
+            
+        Returns:
+            Tuple of (start_date, title) as described in get_anilist_data()
+        """
+        if response is None or response.status_code != 200:
             logging.error(f"Failed to fetch AniList data for ID {anilist_id}")
             return None, None
 
         try:
-            data = response.json()
+            data = orjson.loads(response.content)
             media = data.get('data', {}).get('Media')
+            return self._parse_anilist_media(media)
             
-            if not media:
-                return None, None
+        except (ValueError, KeyError) as e:
+            logging.error(f"Error parsing AniList response: {e}")
+            return None, None
 
-            # Extract title (prefer English, fall back to Romaji)
-            title = media['title'].get('english') or media['title'].get('romaji')
+    def _build_anilist_batch_query(self, anilist_ids: List[int]) -> str:
+        """
+        Build a GraphQL document with one aliased Media lookup per ID.
+        
+        Args:
+            anilist_ids: AniList database IDs
             
-            # Parse date
-            date_parts = media['startDate']
-            if all([date_parts.get('year'), date_parts.get('month'), date_parts.get('day')]):
-                start_date = f"{date_parts['year']}-{date_parts['month']:02d}-{date_parts['day']:02d}"
-                return start_date, title
-                
-            return None, title
+        Returns:
+            Query string with aliases m0, m1, ... in the order of anilist_ids
+        """
+        return 'query { ' + ' '.join(
+            _ANILIST_MEDIA_BATCH_FRAGMENT % (i, anilist_id)
+            for i, anilist_id in enumerate(anilist_ids)
+        ) + ' }'
+
+    def _parse_anilist_batch_response(
+        self, 
+        anilist_ids: List[int], 
+        response
+    ) -> Optional[Dict[int, Tuple[Optional[str], Optional[str]]]]:
+        """
+        Parse an aliased AniList batch response.
+        
+        Args:
+            anilist_ids: AniList database IDs in query order
+            response: HTTP response (requests or httpx), or None if the request failed
+            
+        Returns:
+            Dictionary mapping {anilist_id: (start_date, title)}, or None on failure
+        """
+        # AniList answers 404 with partial data when any aliased ID is unknown
+        if response is None or response.status_code not in (200, 404):
+            logging.error(f"Failed to fetch AniList batch of {len(anilist_ids)} IDs")
+            return None
+
+        try:
+            data = orjson.loads(response.content).get('data') or {}
+            return {
+                anilist_id: self._parse_anilist_media(data.get(f'm{i}'))
+                for i, anilist_id in enumerate(anilist_ids)
+                if f'm{i}' in data
+            }
             
         except (ValueError, KeyError) as e:
-            logging.error(f"Error parsing AniList response: {e}")
-            return None, None
+            logging.error(f"Error parsing AniList batch response: {e}")
+            return None
 
-    def get_tmdb_seasons(self, tmdb_show_id: int) -> List[Dict]:
+    def _parse_anilist_media(
+        self, 
+        media: Optional[Dict]
+    ) -> Tuple[Optional[str], Optional[str]]:
         """
-        Fetch all seasons for a TMDB TV show.
+        Extract the start date and title from an AniList Media object.
         
         Args:
-            tmdb_show_id: The TMDB show ID (not season ID)
+            media: Media object from the GraphQL response, or None
             
         Returns:
-            List of season dictionaries containing id, season_number, air_date, etc.
+            Tuple of (start_date, title) as described in get_anilist_data()
         """
-        url = f"{self.tmdb_base_url}/tv/{tmdb_show_id}"
+        if not media:
+            return None, None
+
+        # Extract title (prefer English, fall back to Romaji)
+        title = media['title'].get('english') or media['title'].get('romaji')
         
-        # Support both API key and Bearer token authentication
-        headers = {}
-        params = {}
+        # Parse date
+        date_parts = media['startDate']
+        if all([date_parts.get('year'), date_parts.get('month'), date_parts.get('day')]):
+            start_date = f"{date_parts['year']}-{date_parts['month']:02d}-{date_parts['day']:02d}"
+            return start_date, title
+            
+        return None, title
+
+    def _read_seasons_cache(self) -> Dict[int, Dict]:
+        """
+        Load persisted TMDB season lists, dropping entries older than the TTL.
         
-        if len(self.tmdb_api_key) > 60:  # v4 Bearer token
-            headers["Authorization"] = f"Bearer {self.tmdb_api_key}"
-        else:  # v3 API key
-            params["api_key"] = self.tmdb_api_key
+        Returns:
+            Dictionary mapping {tmdb_show_id: cache entry}, see _make_seasons_entry()
+        """
+        if not os.path.exists(self.seasons_cache_path):
+            return {}
+            
+        try:
+            with open(self.seasons_cache_path, "rb") as f:
+                raw_cache = orjson.loads(f.read())
+        except (OSError, ValueError) as e:
+            logging.warning(f"Ignoring unreadable seasons cache: {e}")
+            return {}
+            
+        if not isinstance(raw_cache, dict):
+            logging.warning("Ignoring malformed seasons cache")
+            return {}
+            
+        cutoff = time.time() - self.seasons_cache_ttl
+        cache = {}
+        for show_id, entry in raw_cache.items():
+            # Skip entries that don't look like what save_seasons_cache() writes
+            try:
+                show_id = int(show_id)
+                fetched_at = entry["fetched_at"]
+                seasons = entry["seasons"]
+            except (TypeError, ValueError, KeyError):
+                continue
+                
+            if (
+                not isinstance(fetched_at, (int, float))
+                or not isinstance(seasons, list)
+                or not all(
+                    isinstance(season, dict)
+                    and isinstance(season.get('air_date') or '', str)
+                    for season in seasons
+                )
+                or fetched_at < cutoff
+            ):
+                continue
+                
+            cache[show_id] = self._make_seasons_entry(seasons, fetched_at)
+        return cache
 
-        response = self._make_request("GET", url, headers=headers, params=params)
+    def save_seasons_cache(self) -> None:
+        """Persist the TMDB season lists fetched so far for use by later runs."""
+        with self._seasons_lock:
+            snapshot = {
+                show_id: {"fetched_at": entry["fetched_at"], "seasons": entry["seasons"]}
+                for show_id, entry in self._seasons_cache.items()
+            }
+            
+        try:
+            with open(self.seasons_cache_path, "wb") as f:
+                f.write(orjson.dumps(snapshot, option=orjson.OPT_NON_STR_KEYS))
+        except OSError as e:
+            logging.warning(f"Could not write seasons cache: {e}")
 
-        if not response:
-            return []
+    def _make_seasons_entry(self, seasons: List[Dict], fetched_at: float) -> Dict:
+        """
+        Build a season cache entry with precomputed air date lookups.
+        
+        Parsing each air date once per show means matching an AniList entry
+        only compares integers, however many entries share the show. Exact
+        date matches (the common case) are a single dictionary lookup.
+        
+        Args:
+            seasons: Season dictionaries from TMDB
+            fetched_at: Timestamp the seasons were fetched at
+            
+        Returns:
+            Dictionary with fetched_at, seasons, by_date (air_date -> first
+            season airing that day) and ordinals (one day ordinal per season,
+            None where air_date is missing or invalid)
+        """
+        by_date = {}
+        for season in seasons:
+            if season.get('air_date'):
+                by_date.setdefault(season['air_date'], season)
+                
+        return {
+            "fetched_at": fetched_at,
+            "seasons": seasons,
+            "by_date": by_date,
+            "ordinals": [
+                _parse_ymd(season['air_date']) if season.get('air_date') else None
+                for season in seasons
+            ],
+        }
+
+    def _store_seasons(self, tmdb_show_id: int, seasons: Optional[List[Dict]]) -> Dict:
+        """
+        Cache a freshly fetched season list.
+        
+        Args:
+            tmdb_show_id: The TMDB show ID (not season ID)
+            seasons: Result of the TMDB request, None if it failed
+            
+        Returns:
+            The new cache entry; an empty, uncached entry if seasons is None
+        """
+        if seasons is None:
+            return self._make_seasons_entry([], time.time())
+
+        entry = self._make_seasons_entry(seasons, time.time())
+        with self._seasons_lock:
+            self._seasons_cache[tmdb_show_id] = entry
+        return entry
+
+    def _parse_tmdb_seasons_response(
+        self, 
+        tmdb_show_id: int, 
+        response
+    ) -> Optional[List[Dict]]:
+        """
+        Parse a TMDB TV show response into its season list.
+        
+        Args:
+            tmdb_show_id: The TMDB show ID that was requested
+            response: HTTP response (requests or httpx), or None if the request failed
+            
+        Returns:
+            List of season dictionaries (empty if the show does not exist),
+            or None on transient errors that should not be cached
+        """
+        if response is None:
+            return None
             
         if response.status_code == 404:
             logging.warning(f"TMDB show {tmdb_show_id} not found (404)")
@@ -207,40 +749,397 @@ class SeasonMapper:
             
         if response.status_code != 200:
             logging.error(f"TMDB API error {response.status_code}: {response.text[:200]}")
-            return []
+            return None
 
         try:
-            return response.json().get('seasons', [])
+            return orjson.loads(response.content).get('seasons', [])
         except ValueError as e:
             logging.error(f"Error parsing TMDB response: {e}")
-            return []
+            return None
 
-    def _get_date_difference(self, date1: str, date2: str) -> Optional[int]:
+    def _match_season(
+        self, 
+        anilist_id: int, 
+        title: Optional[str], 
+        anilist_date: str, 
+        themoviedb_id: int, 
+        seasons_entry: Dict, 
+        tolerance: int
+    ) -> Dict:
         """
-        Calculate the absolute difference in days between two dates.
+        Pick the season whose air date is closest to the AniList start date.
         
         Args:
-            date1: First date string in YYYY-MM-DD format
-            date2: Second date string in YYYY-MM-DD format
+            anilist_id: The AniList anime ID
+            title: AniList title
+            anilist_date: AniList start date in YYYY-MM-DD format
+            themoviedb_id: TMDB show ID
+            seasons_entry: Season cache entry for the show
+            tolerance: Maximum days difference to consider a match
             
         Returns:
-            Absolute difference in days, or None if dates are invalid
+            Mapping dictionary as described in process_id(); season fields are
+            None when no season matches
         """
-        if not date1 or not date2:
-            return None
+        seasons = seasons_entry["seasons"]
+        
+        if not seasons:
+            logging.info(f"No seasons found for TMDB ID {themoviedb_id}. Likely a Movie/OVA.")
+            return {
+                "anilist_id": anilist_id,
+                "title": title,
+                "tmdb_show_id": themoviedb_id,
+                "tmdb_season_id": None,
+                "tmdb_season_number": None,
+                "matched_date": None,
+                "date_difference_days": None
+            }
+
+        best_match = seasons_entry["by_date"].get(anilist_date)
+        smallest_diff = 0 if best_match else None
+        anilist_ordinal = None if best_match else _parse_ymd(anilist_date)
+        
+        # No exact match: scan for the closest date within tolerance
+        if anilist_ordinal is not None:
+            # Ties resolve to the earliest season, as (diff, index) pairs sort that way
+            closest = min(
+                (
+                    (abs(ordinal - anilist_ordinal), index)
+                    for index, ordinal in enumerate(seasons_entry["ordinals"])
+                    if ordinal is not None
+                ),
+                default=None
+            )
+            if closest and closest[0] <= tolerance:
+                smallest_diff, index = closest
+                best_match = seasons[index]
+
+        if best_match:
+            logging.info(
+                f"✅ MATCH: Season {best_match.get('season_number')} "
+                f"(Season ID: {best_match.get('id')}) - {smallest_diff} day(s) difference"
+            )
+            return {
+                "anilist_id": anilist_id,
+                "title": title,
+                "tmdb_show_id": themoviedb_id,
+                "tmdb_season_id": best_match.get('id'),
+                "tmdb_season_number": best_match.get('season_number'),
+                "matched_date": best_match.get('air_date'),
+                "date_difference_days": smallest_diff
+            }
+
+        logging.warning(f"❌ NO MATCH: Likely a movie or OVA, could not match date {anilist_date} in TMDB seasons within {tolerance} days.")
+        return {
+                "anilist_id": anilist_id,
+                "title": title,
+                "tmdb_show_id": themoviedb_id,
+                "tmdb_season_id": None,
+                "tmdb_season_number": None,
+                "matched_date": None,
+                "date_difference_days": None
+            }
+
+
+class SeasonMapper(BaseSeasonMapper):
+    """
+    Maps AniList anime IDs to specific TMDB season IDs using air date matching.
+    
+    Requests are made with a pooled requests session from a thread pool; see
+    BaseSeasonMapper for the shared configuration and caches.
+    """
+    
+    _session_pool_size = 32
+    
+    def __init__(self, tmdb_api_key: str):
+        """
+        Initialize the SeasonMapper with TMDB credentials.
+        
+        Args:
+            tmdb_api_key: TMDB API key (supports both v3 and v4 formats)
+        """
+        super().__init__(tmdb_api_key)
+        
+        # Fetches in progress, so concurrent callers share one request per show
+        self._seasons_inflight: Dict[int, Future] = {}
+        # Background TMDB fetches that overlap with AniList requests
+        self._prefetch_executor = ThreadPoolExecutor(max_workers=8)
+        # Set when run_chunks() is aborting, so workers stop making requests
+        self._stop_event = threading.Event()
+
+    def close(self) -> None:
+        """Wait for background fetches, then save the caches and close the session."""
+        self._prefetch_executor.shutdown(wait=True)
+        super().close()
+
+    def run_chunks(
+        self, 
+        chunks: Iterable[List[Tuple[int, Optional[int]]]], 
+        on_chunk: Callable[[List[Optional[Dict]]], None]
+    ) -> None:
+        """
+        Process task chunks on a thread pool of MAX_WORKERS threads.
+        
+        On any error (including KeyboardInterrupt) queued chunks are cancelled
+        and running ones stop at their next request. Everything that finished
+        is still reported before the error is re-raised.
+        
+        Args:
+            chunks: Lists of (anilist_id, tmdb_id) tuples, at most ANILIST_BATCH_SIZE each
+            on_chunk: Called with the results of each chunk as it completes
+        """
+        self._stop_event.clear()
+        executor = ThreadPoolExecutor(max_workers=MAX_WORKERS)
+        futures = [executor.submit(self.process_chunk, chunk) for chunk in chunks]
+        reported = set()
+        
+        try:
+            # on_chunk runs on this thread only, so it needs no locking
+            for future in as_completed(futures):
+                reported.add(future)
+                on_chunk(future.result())
+                
+        except BaseException:
+            # Cancel queued chunks and wait for running ones, which return
+            # early once they see the stop event
+            self._stop_event.set()
+            executor.shutdown(wait=True, cancel_futures=True)
+            
+            # Keep the chunks (or parts of chunks) that finished
+            for future in futures:
+                if (
+                    future not in reported
+                    and not future.cancelled()
+                    and future.exception() is None
+                    and future.result()
+                ):
+                    on_chunk(future.result())
+            raise
+            
+        executor.shutdown(wait=True)
+
+    def process_chunk(
+        self, 
+        chunk: List[Tuple[int, Optional[int]]]
+    ) -> List[Optional[Dict]]:
+        """
+        Process a chunk of tasks with a single batched AniList lookup.
+        
+        Args:
+            chunk: List of (anilist_id, tmdb_id) tuples
             
+        Returns:
+            One result per task (match dictionary or None), in order; shorter
+            if run_chunks() was stopped partway through the chunk
+        """
+        results = []
         try:
-            d1 = datetime.strptime(date1, "%Y-%m-%d")
-            d2 = datetime.strptime(date2, "%Y-%m-%d")
-            return abs((d1 - d2).days)
-        except ValueError:
-            return None
+            self._process_chunk(chunk, results)
+        except _RunStopped:
+            pass
+        return results
+
+    def _process_chunk(
+        self, 
+        chunk: List[Tuple[int, Optional[int]]], 
+        results: List[Optional[Dict]]
+    ) -> None:
+        """
+        Body of process_chunk(), appending each result as soon as it is known.
+        
+        Args:
+            chunk: List of (anilist_id, tmdb_id) tuples
+            results: List to append the results to
+        """
+        # Look up missing show IDs first so their seasons can be prefetched too
+        if any(not tmdb_id for _, tmdb_id in chunk):
+            mapping = self.load_mapping_data()
+            chunk = [(anilist_id, tmdb_id or mapping.get(anilist_id)) for anilist_id, tmdb_id in chunk]
+            
+        # Warm the season cache while the AniList batch is in flight. Entries
+        # without a show ID can't match, so they are left out of the batch.
+        pending = self.prefetch_tmdb_seasons({tmdb_id for _, tmdb_id in chunk if tmdb_id})
+        mapped_ids = [anilist_id for anilist_id, tmdb_id in chunk if tmdb_id]
+        anilist_data = self.get_anilist_batch(mapped_ids)
+        if anilist_data is None:
+            anilist_data = self.get_anilist_batch(mapped_ids)
+        wait(pending)
+        
+        if anilist_data is None:
+            # Not recorded as matches, so the next run retries them
+            logging.error(f"Skipping {len(mapped_ids)} IDs after the AniList batch failed twice")
+            results.extend([None] * len(chunk))
+            return
+            
+        for anilist_id, tmdb_id in chunk:
+            results.append(
+                self.process_id(anilist_id, tmdb_id, anilist_data=anilist_data.get(anilist_id))
+            )
+
+    @_guarded_request("tmdb_bucket")
+    def _get_json(self, url: str) -> Optional[requests.Response]:
+        """
+        GET a TMDB API endpoint using the precomputed authentication.
+        
+        Args:
+            url: TMDB API URL
+            
+        Returns:
+            Response object if successful, None if all retries failed
+        """
+        return self._session.get(
+            url, headers=self._tmdb_headers, params=self._tmdb_params, timeout=10
+        )
+
+    @_guarded_request("anilist_bucket")
+    def _post_graphql(self, body: Dict) -> Optional[requests.Response]:
+        """
+        POST a GraphQL request to AniList.
+        
+        Args:
+            body: GraphQL payload with "query" and optional "variables"
+            
+        Returns:
+            Response object if successful, None if all retries failed
+        """
+        return self._session.post(
+            self.anilist_url, 
+            data=orjson.dumps(body), 
+            headers=self._graphql_headers, 
+            timeout=10
+        )
+
+    def get_anilist_data(self, anilist_id: int) -> Tuple[Optional[str], Optional[str]]:
+        """
+        Fetch start date and title from AniList for a given anime ID.
+        
+        Args:
+            anilist_id: The AniList database ID
+            
+        Returns:
+            Tuple of (start_date, title) where start_date is in YYYY-MM-DD format,
+            or (None, title) if date is unavailable
+        """
+        response = self._post_graphql(
+            {'query': _ANILIST_MEDIA_QUERY, 'variables': {'id': anilist_id}}
+        )
+        return self._parse_anilist_response(anilist_id, response)
+
+    def get_anilist_batch(
+        self, 
+        anilist_ids: List[int]
+    ) -> Optional[Dict[int, Tuple[Optional[str], Optional[str]]]]:
+        """
+        Fetch start dates and titles for several AniList IDs in one request.
+        
+        Uses GraphQL aliases (m0, m1, ...) so a whole batch costs a single
+        AniList request. IDs missing from a successful result should be
+        fetched individually with get_anilist_data(); a failed batch should
+        not be, as that multiplies the requests while AniList is struggling.
+        
+        Args:
+            anilist_ids: AniList database IDs (at most ANILIST_BATCH_SIZE)
+            
+        Returns:
+            Dictionary mapping {anilist_id: (start_date, title)}, or None if
+            the request failed
+        """
+        if not anilist_ids:
+            return {}
+            
+        response = self._post_graphql({'query': self._build_anilist_batch_query(anilist_ids)})
+        return self._parse_anilist_batch_response(anilist_ids, response)
+
+    def get_tmdb_seasons(self, tmdb_show_id: int) -> List[Dict]:
+        """
+        Fetch all seasons for a TMDB TV show.
+        
+        Results are cached per show, so AniList entries that share a show only
+        trigger one TMDB request per run (and none while the disk cache is fresh).
+        
+        Args:
+            tmdb_show_id: The TMDB show ID (not season ID)
+            
+        Returns:
+            List of season dictionaries containing id, season_number, air_date, etc.
+        """
+        return self._get_seasons_entry(tmdb_show_id)["seasons"]
+
+    def prefetch_tmdb_seasons(self, tmdb_show_ids: Iterable[int]) -> List[Future]:
+        """
+        Start fetching season lists in the background to warm the cache.
+        
+        Args:
+            tmdb_show_ids: TMDB show IDs whose seasons will be needed soon
+            
+        Returns:
+            One Future per show, resolving to its season cache entry
+        """
+        return [
+            self._prefetch_executor.submit(self._get_seasons_entry, tmdb_show_id)
+            for tmdb_show_id in tmdb_show_ids
+        ]
+
+    def _get_seasons_entry(self, tmdb_show_id: int) -> Dict:
+        """
+        Return the cached season entry for a show, fetching it on a miss.
+        
+        Concurrent misses for the same show are coalesced: the first caller
+        fetches, the others wait for its result.
+        
+        Args:
+            tmdb_show_id: The TMDB show ID (not season ID)
+            
+        Returns:
+            Cache entry as built by _make_seasons_entry(); empty (and not
+            cached) if the request failed
+        """
+        with self._seasons_lock:
+            entry = self._seasons_cache.get(tmdb_show_id)
+            if entry is not None:
+                return entry
+                
+            future = self._seasons_inflight.get(tmdb_show_id)
+            is_owner = future is None
+            if is_owner:
+                future = Future()
+                self._seasons_inflight[tmdb_show_id] = future
+
+        if not is_owner:
+            return future.result()
+
+        try:
+            entry = self._store_seasons(tmdb_show_id, self._fetch_tmdb_seasons(tmdb_show_id))
+            future.set_result(entry)
+            return entry
+        except BaseException as e:
+            future.set_exception(e)
+            raise
+        finally:
+            with self._seasons_lock:
+                del self._seasons_inflight[tmdb_show_id]
+
+    def _fetch_tmdb_seasons(self, tmdb_show_id: int) -> Optional[List[Dict]]:
+        """
+        Request the season list for a TMDB TV show.
+        
+        Args:
+            tmdb_show_id: The TMDB show ID (not season ID)
+            
+        Returns:
+            List of season dictionaries (empty if the show does not exist),
+            or None on transient errors that should not be cached
+        """
+        url = f"{self.tmdb_base_url}/tv/{tmdb_show_id}"
+        response = self._get_json(url)
+        return self._parse_tmdb_seasons_response(tmdb_show_id, response)
 
     def process_id(
         self, 
         anilist_id: int, 
         themoviedb_id: Optional[int] = None,
-        tolerance: int = 7
+        tolerance: int = 7,
+        anilist_data: Optional[Tuple[Optional[str], Optional[str]]] = None
     ) -> Optional[Dict]:
         """
         Process a single AniList ID and find its corresponding TMDB season.
@@ -255,6 +1154,8 @@ class SeasonMapper:
             anilist_id: The AniList anime ID
             themoviedb_id: Optional TMDB show ID (will be looked up if None)
             tolerance: Maximum days difference to consider a match (default: 7)
+            anilist_data: Optional prefetched (start_date, title) from
+                get_anilist_batch(); fetched individually if None
             
         Returns:
             Dictionary containing mapping information if match found, None otherwise.
@@ -277,8 +1178,13 @@ class SeasonMapper:
             logging.warning(f"No mapping found for AniList ID {anilist_id}")
             return None
 
-        # Step 2: Get AniList start date
-        anilist_date, title = self.get_anilist_data(anilist_id)
+        # Step 2: Get AniList start date, fetching the TMDB seasons for step 3
+        # in the background meanwhile since the show ID is already known
+        seasons_future = None
+        if anilist_data is None:
+            seasons_future = self._prefetch_executor.submit(self._get_seasons_entry, themoviedb_id)
+            anilist_data = self.get_anilist_data(anilist_id)
+        anilist_date, title = anilist_data
         if not anilist_date:
             logging.warning(f"No start date found for AniList ID {anilist_id}")
             return None
@@ -286,53 +1192,12 @@ class SeasonMapper:
         logging.info(f"Processing: {title} | Date: {anilist_date}")
 
         # Step 3: Get TMDB seasons
-        seasons = self.get_tmdb_seasons(themoviedb_id)
+        if seasons_future:
+            seasons_entry = seasons_future.result()
+        else:
+            seasons_entry = self._get_seasons_entry(themoviedb_id)
         
-        if not seasons:
-            logging.info(f"No seasons found for TMDB ID {themoviedb_id}. Likely a Movie/OVA.")
-            return {
-                "anilist_id": anilist_id,
-                "title": title,
-                "tmdb_show_id": themoviedb_id,
-                "tmdb_season_id": None,
-                "tmdb_season_number": None,
-                "matched_date": None,
-                "date_difference_days": None
-            }
-
         # Step 4: Find closest matching season by date
-        best_match = None
-        smallest_diff = float('inf')
-        
-        for season in seasons:
-            diff = self._get_date_difference(anilist_date, season.get('air_date'))
-            
-            if diff is not None and diff <= tolerance and diff < smallest_diff:
-                smallest_diff = diff
-                best_match = season
-
-        if best_match:
-            logging.info(
-                f"✅ MATCH: Season {best_match.get('season_number')} "
-                f"(Season ID: {best_match.get('id')}) - {smallest_diff} day(s) difference"
-            )
-            return {
-                "anilist_id": anilist_id,
-                "title": title,
-                "tmdb_show_id": themoviedb_id,
-                "tmdb_season_id": best_match.get('id'),
-                "tmdb_season_number": best_match.get('season_number'),
-                "matched_date": best_match.get('air_date'),
-                "date_difference_days": smallest_diff
-            }
-
-        logging.warning(f"❌ NO MATCH: Likely a movie or OVA, could not match date {anilist_date} in TMDB seasons within {tolerance} days.")
-        return {
-                "anilist_id": anilist_id,
-                "title": title,
-                "tmdb_show_id": themoviedb_id,
-                "tmdb_season_id": None,
-                "tmdb_season_number": None,
-                "matched_date": None,
-                "date_difference_days": None
-            }
\ No newline at end of file
+        return self._match_season(
+            anilist_id, title, anilist_date, themoviedb_id, seasons_entry, tolerance
+        )